@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
+import errno
+import json
+import mmap
 import os
 import sys
 import re
 import shutil
+import struct
 import subprocess
-import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
-from enum import Enum
+from typing import Optional, Tuple, List, Dict, Iterator, Union
 
 # Third-party imports
 try:
@@ -27,26 +33,46 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Precompiled struct layouts for the binary parsers (one format parse, not one per call)
+_BOX_HEADER = struct.Struct(">I4s")
+_U16_BE     = struct.Struct(">H")
+_U32_BE     = struct.Struct(">I")
+_U64_BE     = struct.Struct(">Q")
+_U32_LE     = struct.Struct("<I")
+_U16X2_BE   = struct.Struct(">HH")
+_U32X2_BE   = struct.Struct(">II")
+_U16X2_LE   = struct.Struct("<HH")
+_I32X2_LE   = struct.Struct("<ii")
+_QT_16BIT   = struct.Struct(">64H")
+
+
 class MediaExtensions:
-    AUDIO = {'.mp3', '.flac', '.wav', '.m4a', '.ogg', '.opus', '.aac', '.ape'}
-    VIDEO = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-    IMAGE = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff'}
-    LOSSLESS_AUDIO = {'.flac', '.wav', '.ape'}
+    AUDIO = frozenset({'.mp3', '.flac', '.wav', '.m4a', '.ogg', '.opus', '.aac', '.ape'})
+    VIDEO = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'})
+    IMAGE = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff'})
+    LOSSLESS_AUDIO = frozenset({'.flac', '.wav', '.ape'})
+    
+    @staticmethod
+    def ext(filepath: Union[str, Path]) -> str:
+        # Works on plain names (e.g. DirEntry.name) without building a Path
+        return os.path.splitext(filepath)[1].lower()
     
     @classmethod
-    def is_audio(cls, filepath: Path) -> bool:
-        return filepath.suffix.lower() in cls.AUDIO
+    def is_audio(cls, filepath: Union[str, Path]) -> bool:
+        return cls.ext(filepath) in cls.AUDIO
     
     @classmethod
-    def is_video(cls, filepath: Path) -> bool:
-        return filepath.suffix.lower() in cls.VIDEO
+    def is_video(cls, filepath: Union[str, Path]) -> bool:
+        return cls.ext(filepath) in cls.VIDEO
     
     @classmethod
-    def is_image(cls, filepath: Path) -> bool:
-        return filepath.suffix.lower() in cls.IMAGE
+    def is_image(cls, filepath: Union[str, Path]) -> bool:
+        return cls.ext(filepath) in cls.IMAGE
 
 
 class PathUtils:
+    UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*]')
+
     @staticmethod
     def ensure_output_dir(base_dir: Path, subfolder: str = "Output") -> Path:
         output_dir = base_dir / subfolder
@@ -65,64 +91,106 @@ class PathUtils:
                 return path
             print("Error: Path not found.")
     
+    @staticmethod
+    def move(src: Path, dst: Path):
+        """Rename src to dst, copying across filesystems only when a rename can't.
+
+        A plain rename is one syscall; shutil.move is used just for the EXDEV
+        case (e.g. a destination folder that is a mount point or symlink to
+        another drive), where it copies then removes the source.
+        """
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dst))
+
     @staticmethod
     def sanitize_filename(name: str) -> str:
-        return re.sub(r'[<>:"/\\|?*]', '_', name)
+        return PathUtils.UNSAFE_CHARS.sub('_', name)
 
 
 class AudioMetadata:
-    def __init__(self, filepath: Path):
+    # Format-specific loaders skip mutagen.File's probe of every known format
+    LOADERS = {
+        '.mp3':  partial(MP3, ID3=EasyID3),
+        '.flac': FLAC,
+        '.m4a':  MP4,
+        '.mp4':  MP4,
+        '.opus': OggOpus,
+        '.ogg':  OggVorbis,
+    }
+    # Tag-only loaders for callers that never touch stream info: EasyID3 reads
+    # just the ID3 block instead of also syncing to MPEG frames for MP3 info
+    TAG_LOADERS = {
+        '.mp3':  EasyID3,
+    }
+    MP4_KEYS = {
+        'artist': '\xa9ART',
+        'album': '\xa9alb',
+        'title': '\xa9nam',
+        'genre': '\xa9gen',
+        'date': '\xa9day',
+        'discnumber': 'disk',
+    }
+
+    def __init__(self, filepath: Path, tags_only: bool = False):
         self.filepath = filepath
+        self.tags_only = tags_only
         self.audio = self._load_audio()
+        # Resolve the tag container once so get() is a single dict lookup per field
+        if isinstance(self.audio, MP4):
+            self._tags, self._keys = self.audio.tags or {}, self.MP4_KEYS
+        else:
+            self._tags, self._keys = self.audio, {}
     
     def _load_audio(self):
         ext = self.filepath.suffix.lower()
+        loader = (self.tags_only and self.TAG_LOADERS.get(ext)) or self.LOADERS.get(ext)
         try:
-            if ext == '.mp3':
-                return MP3(self.filepath, ID3=EasyID3)
-            elif ext == '.flac':
-                return FLAC(self.filepath)
-            elif ext in {'.m4a', '.mp4'}:
-                return MP4(self.filepath)
-            elif ext == '.opus':
-                return OggOpus(self.filepath)
-            elif ext == '.ogg':
-                return OggVorbis(self.filepath)
-            else:
-                return MutagenFile(self.filepath)
+            if loader:
+                return loader(self.filepath)
+            return MutagenFile(self.filepath, easy=True)
         except:
             return None
     
     def get(self, field: str, default: Optional[str] = None) -> Optional[str]:
-        if not self.audio:
-            return default
-        
-        if isinstance(self.audio, MP4):
-            mp4_map = {
-                'artist': '\xa9ART',
-                'album': '\xa9alb',
-                'title': '\xa9nam',
-                'genre': '\xa9gen',
-                'date': '\xa9day',
-                'discnumber': 'disk',
-            }
-            key = mp4_map.get(field, field)
-            if key in self.audio.tags:
-                value = self.audio.tags[key]
-                return str(value[0]) if isinstance(value, list) else str(value)
+        if not self._tags:
             return default
-        
-        if field not in self.audio:
+        value = self._tags.get(self._keys.get(field, field))
+        if value is None:
             return default
-        value = self.audio[field]
         return str(value[0]) if isinstance(value, list) else str(value)
 
 
 class FileScanner:
+    @staticmethod
+    def iter_files(directory: Path, extensions: set, recursive: bool = False) -> Iterator[Path]:
+        # scandir reports each entry's type from the directory read itself, so
+        # unlike glob() + is_file() there is no extra stat per entry. As with
+        # glob("**/*"), symlinked folders are not descended into (a link back
+        # up the tree would otherwise loop forever) and unreadable folders are
+        # ignored. Matches are yielded as they are read, so a caller that
+        # stops early never lists the rest of the tree.
+        pending = [directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        # Extension first: one frozenset lookup rejects most
+                        # entries before any Path object is built
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in extensions and entry.is_file():
+                            yield Path(entry.path)
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+            except OSError:
+                continue
+
     @staticmethod
     def scan(directory: Path, extensions: set, recursive: bool = False) -> List[Path]:
-        pattern = "**/*" if recursive else "*"
-        return [f for f in directory.glob(pattern) if f.is_file() and f.suffix.lower() in extensions]
+        return list(FileScanner.iter_files(directory, extensions, recursive))
     
     @staticmethod
     def scan_audio(directory: Path, recursive: bool = False) -> List[Path]:
@@ -194,12 +262,66 @@ def clear():
     os.system('clear')
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg():
+    # A PATH lookup answers "is ffmpeg installed?" without forking it, and the
+    # answer cannot change while the menu is running, so it is asked only once.
+    return shutil.which('ffmpeg') is not None
+
+
+def run_ffmpeg(args: List[str]) -> Optional[str]:
+    """Run ffmpeg with args; return None on success, otherwise its first error line.
+
+    -nostats -loglevel error keeps ffmpeg from writing progress and banner
+    output, so stderr only carries real errors and is decoded only on failure.
+    The first line is the cause; newer ffmpeg ends with a generic trailer such
+    as "Nothing was written into output file".
+    """
+    r = subprocess.run(['ffmpeg', '-nostdin', '-nostats', '-loglevel', 'error', '-y'] + args,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if r.returncode == 0:
+        return None
+    for line in r.stderr.decode(errors='replace').splitlines():
+        if line.strip():
+            return line.strip()
+    return f"ffmpeg exited {r.returncode}"
+
+
+def ffmpeg_job(args: List[str]) -> Tuple[bool, Optional[Exception]]:
+    """run_ffmpeg as a (success, error) record for run_parallel workers."""
     try:
-        subprocess.run(['ffmpeg', '-version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-        return True
-    except:
-        return False
+        err = run_ffmpeg(args)
+    except Exception as e:
+        return False, e
+    return err is None, None if err is None else RuntimeError(err)
+
+
+def run_parallel(func, items: List, max_workers: Optional[int] = None):
+    """Yield func(item) for every item, in input order, running several at once.
+
+    Threads are enough here: the per-file work is an ffmpeg/ffprobe child process
+    or C-level codec code, both of which run outside the GIL. Only a few tasks
+    per worker are queued ahead of the consumer, so a huge folder does not
+    build one future per file before the first result is handed back.
+    """
+    if len(items) <= 1:
+        yield from map(func, items)
+        return
+    workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pending = deque()
+        try:
+            for item in items:
+                if len(pending) >= workers * 4:
+                    yield pending.popleft().result()
+                pending.append(ex.submit(func, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Reached early when the consumer stops (Ctrl+C, an error):
+            # drop queued jobs so only the ones already running finish.
+            for fut in pending:
+                fut.cancel()
 
 
 # ============================================================================
@@ -207,9 +329,28 @@ def check_ffmpeg():
 # ============================================================================
 
 class MusicOrganizer:
+    # Tag reads are small I/O-bound parses; same sizing as Python's I/O default
+    TAG_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
         self.stats = {'moved': 0, 'skipped': 0, 'failed': 0}
+        self._created = set()
+
+    def _ensure_dir(self, dest: Path):
+        # Many tracks share one album folder; only the first one pays for mkdir
+        if dest not in self._created:
+            dest.mkdir(parents=True, exist_ok=True)
+            self._created.add(dest)
+
+    def _read_metadata(self, files: List[Path]):
+        """Yield (file, AudioMetadata) in order, reading tags ahead on a thread pool.
+
+        Only the tag reads run concurrently; the caller creates folders and
+        moves files serially from this thread as results arrive.
+        """
+        read = partial(AudioMetadata, tags_only=True)
+        return zip(files, run_parallel(read, files, self.TAG_WORKERS))
     
     def by_artist(self, recursive: bool = False):
         files = FileScanner.scan_audio(self.base_dir, recursive)
@@ -218,9 +359,8 @@ class MusicOrganizer:
             return
         
         print(f"Organizing {len(files)} files by Artist > Album...")
-        for f in files:
+        for f, meta in self._read_metadata(files):
             try:
-                meta = AudioMetadata(f)
                 artist = meta.get('artist')
                 album = meta.get('album')
                 
@@ -230,14 +370,14 @@ class MusicOrganizer:
                     continue
                 
                 dest = self.base_dir / PathUtils.sanitize_filename(artist) / PathUtils.sanitize_filename(album)
-                dest.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(dest)
                 dest_path = dest / f.name
                 
                 if dest_path.exists():
                     self.stats['skipped'] += 1
                     continue
                 
-                f.rename(dest_path)
+                PathUtils.move(f, dest_path)
                 print(f"OK {f.name} -> {artist}/{album}/")
                 self.stats['moved'] += 1
             except Exception as e:
@@ -253,16 +393,15 @@ class MusicOrganizer:
             return
         
         print(f"Organizing {len(files)} files by Album...")
-        for f in files:
+        for f, meta in self._read_metadata(files):
             try:
-                meta = AudioMetadata(f)
                 album = meta.get('album', 'No Album')
                 dest = self.base_dir / PathUtils.sanitize_filename(album)
-                dest.mkdir(exist_ok=True)
+                self._ensure_dir(dest)
                 dest_path = dest / f.name
                 
                 if not dest_path.exists():
-                    f.rename(dest_path)
+                    PathUtils.move(f, dest_path)
                     print(f"OK {f.name} -> {album}/")
                     self.stats['moved'] += 1
                 else:
@@ -280,9 +419,8 @@ class MusicOrganizer:
             return
         
         print(f"Organizing {len(files)} files by Genre > Artist > Album...")
-        for f in files:
+        for f, meta in self._read_metadata(files):
             try:
-                meta = AudioMetadata(f)
                 artist = meta.get('artist')
                 album = meta.get('album')
                 genre = meta.get('genre', 'No Genre')
@@ -292,11 +430,11 @@ class MusicOrganizer:
                 else:
                     dest = self.base_dir / PathUtils.sanitize_filename(genre) / PathUtils.sanitize_filename(artist) / PathUtils.sanitize_filename(album)
                 
-                dest.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(dest)
                 dest_path = dest / f.name
                 
                 if not dest_path.exists():
-                    f.rename(dest_path)
+                    PathUtils.move(f, dest_path)
                     print(f"OK {f.name}")
                     self.stats['moved'] += 1
                 else:
@@ -320,9 +458,10 @@ def organize_by_disc(directory: Path):
     
     print(f"Organizing {len(files)} files by disc number...")
     moved = 0
+    created = set()
     for f in files:
         try:
-            meta = AudioMetadata(f)
+            meta = AudioMetadata(f, tags_only=True)
             disc = meta.get('discnumber', 'Unknown CD')
             
             if disc and disc != 'Unknown CD':
@@ -332,11 +471,13 @@ def organize_by_disc(directory: Path):
                 folder_name = 'Unknown CD'
             
             dest = directory / folder_name
-            dest.mkdir(exist_ok=True)
+            if folder_name not in created:
+                dest.mkdir(exist_ok=True)
+                created.add(folder_name)
             dest_path = dest / f.name
             
             if not dest_path.exists():
-                f.rename(dest_path)
+                PathUtils.move(f, dest_path)
                 print(f"OK {f.name} -> {folder_name}/")
                 moved += 1
         except Exception as e:
@@ -349,22 +490,21 @@ def organize_by_disc(directory: Path):
 # TOOL 5: CHANGE VOLUME
 # ============================================================================
 
+def _adjust_volume_file(f: Path, db: float, output: Path) -> Tuple[bool, Optional[Exception]]:
+    # Gain is applied in a single ffmpeg filter pass.
+    return ffmpeg_job(['-i', str(f), '-af', f'volume={db}dB', str(output / f.name)])
+
+
 def adjust_volume(files: List[Path], db: float, output: Path):
     output.mkdir(exist_ok=True)
     ok, fail = 0, 0
-    for f in files:
-        try:
-            out = output / f.name
-            r = subprocess.run(['ffmpeg', '-i', str(f), '-af', f'volume={db}dB', '-y', str(out)],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if r.returncode == 0:
-                print(f"OK {f.name} ({db:+.1f} dB)")
-                ok += 1
-            else:
-                print(f"ERR {f.name}")
-                fail += 1
-        except Exception as e:
-            print(f"ERR {f.name}: {e}")
+    results = run_parallel(partial(_adjust_volume_file, db=db, output=output), files)
+    for f, (success, err) in zip(files, results):
+        if success:
+            print(f"OK {f.name} ({db:+.1f} dB)")
+            ok += 1
+        else:
+            print(f"ERR {f.name}: {err}")
             fail += 1
     print(f"\nProcessed: {ok} | Failed: {fail}")
 
@@ -423,23 +563,24 @@ def compare_audio_spectrograms(file1: Path, file2: Path):
 # TOOL 7: CONVERT TO OPUS
 # ============================================================================
 
+def _convert_opus_file(f: Path, bitrate: int, output: Path) -> Tuple[bool, Optional[Exception]]:
+    # Tags carry over through ffmpeg's default global metadata mapping;
+    # -vn keeps embedded cover art from being decoded for an audio-only target.
+    return ffmpeg_job(['-i', str(f), '-vn', '-c:a', 'libopus', '-b:a', f'{bitrate}k',
+                       '-vbr', 'on', str(output / f"{f.stem}.opus")])
+
+
 def convert_opus(files: List[Path], lossless: bool, output: Path):
     output.mkdir(exist_ok=True)
     bitrate = 448 if lossless else 320
     ok, fail = 0, 0
-    for f in files:
-        try:
-            out = output / f"{f.stem}.opus"
-            r = subprocess.run(['ffmpeg', '-i', str(f), '-c:a', 'libopus', '-b:a', f'{bitrate}k',
-                              '-vbr', 'on', '-y', str(out)],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if r.returncode == 0:
-                print(f"OK {f.name} -> {out.name} ({bitrate}k)")
-                ok += 1
-            else:
-                fail += 1
-        except Exception as e:
-            print(f"ERR {f.name}: {e}")
+    results = run_parallel(partial(_convert_opus_file, bitrate=bitrate, output=output), files)
+    for f, (success, err) in zip(files, results):
+        if success:
+            print(f"OK {f.name} -> {f.stem}.opus ({bitrate}k)")
+            ok += 1
+        else:
+            print(f"ERR {f.name}: {err}")
             fail += 1
     print(f"\nConverted: {ok} | Failed: {fail}")
 
@@ -448,6 +589,18 @@ def convert_opus(files: List[Path], lossless: bool, output: Path):
 # TOOL 8: LOSSLESS SEPARATOR (CUE SPLITTER)
 # ============================================================================
 
+def _probe_audio_codec(f: Path) -> Optional[str]:
+    """Return the codec name of the first audio stream, e.g. 'pcm_s24le'."""
+    try:
+        r = subprocess.run(['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+                          '-show_entries', 'stream=codec_name',
+                          '-of', 'default=noprint_wrappers=1:nokey=1', str(f)],
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10)
+        return r.stdout.strip() or None
+    except Exception:
+        return None
+
+
 def split_lossless_album(filepath: Path):
     # Accept a directory — auto-detect the lossless file inside it
     if filepath.is_dir():
@@ -470,7 +623,8 @@ def split_lossless_album(filepath: Path):
 
     # 2. Fallback: any single .cue file in the same directory
     if not cue_file.exists():
-        cue_candidates = list(directory.glob("*.cue"))
+        # Two matches already make it ambiguous, so stop reading the folder there
+        cue_candidates = list(islice(FileScanner.iter_files(directory, {'.cue'}), 2))
         if len(cue_candidates) == 1:
             cue_file = cue_candidates[0]
         elif len(cue_candidates) > 1:
@@ -491,57 +645,69 @@ def split_lossless_album(filepath: Path):
         print("ERR Could not parse any tracks from CUE file.")
         return
 
+    # Re-encode instead of stream-copy so ffmpeg writes a fresh STREAMINFO
+    # block with the correct total_samples for this segment. With -c copy the
+    # original album's sample count is preserved verbatim, making players show
+    # the full album duration regardless of actual content length.
+    # FLAC is lossless at any compression level; 0 is fastest.
+    # WAV is re-encoded too: a stream copy can only stop on a packet boundary,
+    # so each track would run into the next. Encoding back to the source's
+    # own PCM format keeps the cut exact and 24-bit sources intact.
+    # The codec choice depends only on the album file, so it is made once here.
+    ext = filepath.suffix.lower()
+    if ext == '.flac':
+        out_ext, codec_args = '.flac', ['-c:a', 'flac', '-compression_level', '0']
+    elif ext == '.wav':
+        pcm = _probe_audio_codec(filepath)
+        if not (pcm and pcm.startswith('pcm_')):
+            pcm = 'pcm_s16le'
+        out_ext, codec_args = '.wav', ['-c:a', pcm]
+    else:
+        # APE and others: transcode to FLAC (APE muxing in ffmpeg is unreliable)
+        out_ext, codec_args = '.flac', ['-c:a', 'flac', '-compression_level', '0']
+
     ok, fail = 0, 0
     for i, track in enumerate(tracks):
         num    = track['number']
         title  = PathUtils.sanitize_filename(track.get('title', f'Track {num}'))
         start  = track['start']
         end    = tracks[i + 1]['start'] if i + 1 < len(tracks) else None
-        ext    = filepath.suffix.lower()
-        out    = output_dir / f"{num:02d} - {title}{ext}"
+        out    = output_dir / f"{num:02d} - {title}{out_ext}"
 
         # Input-side -ss: ffmpeg seeks before opening the file, so output
         # timestamps start at 0 instead of retaining the album position.
         # Use -t (duration) instead of -to (absolute end) for the same reason.
         duration = (end - start) if end is not None else None
-        cmd = ['ffmpeg', '-y', '-ss', str(start), '-i', str(filepath)]
+        args = ['-ss', str(start), '-i', str(filepath)]
         if duration is not None:
-            cmd += ['-t', str(duration)]
-        # Re-encode instead of stream-copy so ffmpeg writes a fresh STREAMINFO
-        # block with the correct total_samples for this segment. With -c copy the
-        # original album's sample count is preserved verbatim, making players show
-        # the full album duration regardless of actual content length.
-        # FLAC is lossless at any compression level; 0 is fastest.
-        if ext == '.flac':
-            cmd += ['-c:a', 'flac', '-compression_level', '0', str(out)]
-        elif ext == '.wav':
-            cmd += ['-c:a', 'pcm_s16le', str(out)]
-        else:
-            # APE and others: transcode to FLAC (APE muxing in ffmpeg is unreliable)
-            out = out.with_suffix('.flac')
-            cmd += ['-c:a', 'flac', '-compression_level', '0', str(out)]
+            args += ['-t', str(duration)]
+        args += codec_args + [str(out)]
 
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode == 0:
+        err = run_ffmpeg(args)
+        if err is None:
             print(f"OK  {out.name}")
             ok += 1
         else:
-            print(f"ERR Track {num}: {result.stderr.decode(errors='replace').splitlines()[-1]}")
+            print(f"ERR Track {num}: {err}")
             fail += 1
 
     print(f"\nSplit: {ok} | Failed: {fail}")
     print(f"Output: {output_dir}")
 
 
+_CUE_TITLE_RE = re.compile(r'^TITLE\s+"?|"?$', re.IGNORECASE)
+
+
 def _parse_cue(cue_file: Path) -> List[Dict]:
     """Parse a CUE sheet and return a list of track dicts with start times in seconds."""
     tracks = []
     current: Dict = {}
 
-    # CUE files are often latin-1 encoded
+    # CUE files are often latin-1 encoded; read once and only re-decode on failure
+    raw = cue_file.read_bytes()
     for encoding in ('utf-8-sig', 'latin-1'):
         try:
-            text = cue_file.read_text(encoding=encoding)
+            text = raw.decode(encoding)
             break
         except UnicodeDecodeError:
             continue
@@ -550,15 +716,15 @@ def _parse_cue(cue_file: Path) -> List[Dict]:
 
     for line in text.splitlines():
         line = line.strip()
-        if line.upper().startswith('TRACK '):
+        keyword = line[:9].upper()
+        if keyword.startswith('TRACK '):
             if 'number' in current:
                 tracks.append(current)
-            parts = line.split()
-            current = {'number': int(parts[1])}
-        elif line.upper().startswith('TITLE '):
-            title = re.sub(r'^TITLE\s+"?|"?$', '', line, flags=re.IGNORECASE).strip().strip('"')
+            current = {'number': int(line.split(maxsplit=2)[1])}
+        elif keyword.startswith('TITLE '):
+            title = _CUE_TITLE_RE.sub('', line).strip().strip('"')
             current['title'] = title
-        elif line.upper().startswith('INDEX 01 '):
+        elif keyword == 'INDEX 01 ':
             # Format: MM:SS:FF  (FF = frames, 75 per second)
             timestamp = line.split()[-1]
             mm, ss, ff = (int(x) for x in timestamp.split(':'))
@@ -611,20 +777,20 @@ def add_thumbnails(files: List[Path], thumb: Path):
 # TOOL 10: REMOVE AUDIO FROM VIDEO
 # ============================================================================
 
+def _remove_video_audio_file(f: Path, output: Path) -> Tuple[bool, Optional[Exception]]:
+    return ffmpeg_job(['-i', str(f), '-c', 'copy', '-an', str(output / f.name)])
+
+
 def remove_video_audio(files: List[Path], output: Path):
     output.mkdir(exist_ok=True)
     ok, fail = 0, 0
-    for f in files:
-        try:
-            out = output / f.name
-            r = subprocess.run(['ffmpeg', '-i', str(f), '-c', 'copy', '-an', '-y', str(out)],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if r.returncode == 0:
-                print(f"OK {f.name}")
-                ok += 1
-            else:
-                fail += 1
-        except:
+    results = run_parallel(partial(_remove_video_audio_file, output=output), files)
+    for f, (success, err) in zip(files, results):
+        if success:
+            print(f"OK {f.name}")
+            ok += 1
+        else:
+            print(f"ERR {f.name}: {err}")
             fail += 1
     print(f"\nProcessed: {ok} | Failed: {fail}")
 
@@ -633,27 +799,51 @@ def remove_video_audio(files: List[Path], output: Path):
 # TOOL 11: REMOVE METADATA
 # ============================================================================
 
+def _remove_metadata_file(f: Path) -> Tuple[bool, Optional[Exception]]:
+    try:
+        if MediaExtensions.is_image(f):
+            with Image.open(f) as img:
+                # Rebuild from the raw pixel buffer: a new image carries no
+                # info/EXIF/ICC, and the copy stays in C instead of boxing
+                # every pixel into a Python tuple.
+                clean = Image.frombytes(img.mode, img.size, img.tobytes())
+                if img.mode == 'P':
+                    clean.putpalette(img.getpalette())
+                clean.save(f, format=img.format)
+        elif MediaExtensions.is_video(f):
+            # A stream-copy remux drops container, stream and chapter metadata
+            # that mutagen cannot see (Matroska tags, QuickTime atoms) and never
+            # touches the encoded frames. The temp file keeps the suffix so
+            # ffmpeg picks the same muxer.
+            tmp = f.with_name(f".{f.stem}.clean{f.suffix}")
+            err = run_ffmpeg(['-i', str(f), '-map', '0', '-ignore_unknown',
+                              '-map_metadata', '-1', '-map_chapters', '-1',
+                              '-c', 'copy', str(tmp)])
+            if err is not None:
+                tmp.unlink(missing_ok=True)
+                return False, RuntimeError(err)
+            # The remux is a new inode; keep the original's permissions
+            try:
+                shutil.copymode(f, tmp)
+                os.replace(tmp, f)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+        return True, None
+    except Exception as e:
+        return False, e
+
+
 def remove_metadata(files: List[Path]):
     ok, fail = 0, 0
-    for f in files:
-        try:
-            if MediaExtensions.is_image(f):
-                with Image.open(f) as img:
-                    data = list(img.getdata())
-                    clean = Image.new(img.mode, img.size)
-                    clean.putdata(data)
-                    clean.save(f, format=img.format)
-                print(f"OK {f.name}")
-                ok += 1
-            elif MediaExtensions.is_video(f):
-                media = MutagenFile(f)
-                if media:
-                    media.delete()
-                    media.save()
-                print(f"OK {f.name}")
-                ok += 1
-        except Exception as e:
-            print(f"ERR {f.name}: {e}")
+    # Pillow's decode/encode and the ffmpeg remux both run outside the GIL,
+    # so a thread pool scales across files without pickling anything.
+    for f, (success, err) in zip(files, run_parallel(_remove_metadata_file, files)):
+        if success:
+            print(f"OK {f.name}")
+            ok += 1
+        else:
+            print(f"ERR {f.name}: {err}")
             fail += 1
     print(f"\nProcessed: {ok} | Failed: {fail}")
 
@@ -662,35 +852,112 @@ def remove_metadata(files: List[Path]):
 # TOOL 12: ROTATE VIDEO
 # ============================================================================
 
-def rotate_videos(files: List[Path], mode: str, output: Path):
-    """mode: '1'=90°, '2'=180°, '3'=270°, '4'=mirror"""
+# Containers whose display matrix ffmpeg can rewrite while stream-copying
+ROTATION_METADATA_EXTS = frozenset({'.mp4', '.mov', '.m4v'})
+
+
+# One row of ffprobe's displaymatrix dump, e.g. "00000001:       -65536           0           0"
+_DISPLAYMATRIX_ROW_RE = re.compile(r'^[0-9a-f]{8}:\s*(-?\d+)\s+(-?\d+)\s+(-?\d+)', re.MULTILINE)
+# Upper-left 2x2 of the display matrix (16.16 fixed point) for 0/90/180/270°
+_PURE_ROTATIONS = frozenset({
+    (65536, 0, 0, 65536), (0, 65536, -65536, 0),
+    (-65536, 0, 0, -65536), (0, -65536, 65536, 0),
+})
+
+
+def _probe_rotation(f: Path) -> Optional[int]:
+    """Return the counter-clockwise display rotation already stored on the first video stream.
+
+    None means the stored transform cannot be carried over: the probe failed,
+    or the display matrix holds a flip (ffprobe reports a mirrored stream as
+    rotation -180, the same as a plain 180°) or anything but a 90° step. The
+    caller must then re-encode, since -display_rotation replaces the whole
+    matrix and would silently drop the flip.
+    """
+    try:
+        r = subprocess.run(['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+                          '-show_entries', 'stream_side_data=displaymatrix,rotation',
+                          '-of', 'json', str(f)],
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10)
+        if r.returncode != 0:
+            return None
+        streams = json.loads(r.stdout).get('streams') or [{}]
+        for side in streams[0].get('side_data_list', []):
+            if 'displaymatrix' not in side:
+                continue
+            m = [int(v) for row in _DISPLAYMATRIX_ROW_RE.findall(side['displaymatrix']) for v in row]
+            if len(m) != 9 or m[2] or m[5] or (m[0], m[1], m[3], m[4]) not in _PURE_ROTATIONS:
+                return None
+            return int(float(side.get('rotation', 0)))
+        return 0
+    except Exception:
+        return None
+
+
+# Concurrent re-encodes for a rotate batch; libx264 scales well up to about
+# four threads per encode, so the pool and per-encode threads split the CPUs.
+ROTATE_ENCODE_THREADS = 4
+
+
+def _rotate_video_file(f: Path, vf: str, degrees: int, mirror: bool, output: Path,
+                       prefix: str, lossless: bool) -> Tuple[bool, bool, Optional[Exception]]:
+    """Return (succeeded, used the lossless metadata path, error)."""
+    try:
+        out = output / f"{prefix}_{f.name}"
+        stored = _probe_rotation(f) if lossless and f.suffix.lower() in ROTATION_METADATA_EXTS else None
+        # stored is None for any matrix that is not a plain rotation, so a
+        # file this tool already mirrored is re-encoded rather than having
+        # its flip overwritten. The matrix applies its flip and rotation in a
+        # fixed order, so a new mirror is only expressed as metadata on a
+        # stream with an identity matrix.
+        if stored is not None and not (mirror and stored % 360):
+            # display_rotation is counter-clockwise and replaces the stored
+            # matrix, so fold in any rotation the file already carries.
+            # -map 0 keeps every stream (extra audio tracks, subtitles) that
+            # the default one-video-one-audio selection would drop on a remux.
+            args = ['-display_rotation', str((stored - degrees) % 360)]
+            if mirror:
+                args.append('-display_hflip')
+            if run_ffmpeg(args + ['-i', str(f), '-map', '0', '-ignore_unknown',
+                                  '-map_metadata', '0', '-c', 'copy', str(out)]) is None:
+                return True, True, None
+        success, err = ffmpeg_job(['-i', str(f), '-vf', vf, '-c:a', 'copy',
+                                   '-threads', str(ROTATE_ENCODE_THREADS), str(out)])
+        return success, False, err
+    except Exception as e:
+        return False, False, e
+
+
+def rotate_videos(files: List[Path], mode: str, output: Path, lossless: bool = True):
+    """mode: '1'=90°, '2'=180°, '3'=270°, '4'=mirror
+
+    With lossless set, MP4/MOV transforms only rewrite the display matrix
+    (stream copy, no re-encode); anything else, or an ffmpeg too old for
+    -display_rotation (< 6.1), goes through the re-encoding filter path.
+    """
     output.mkdir(exist_ok=True)
     vf_map = {
-        '1': ('transpose=1', '90°'),
-        '2': ('hflip,vflip', '180°'),
-        '3': ('transpose=2', '270°'),
-        '4': ('hflip',       'mirror'),
+        '1': ('transpose=1', '90°',    90),
+        '2': ('hflip,vflip', '180°',   180),
+        '3': ('transpose=2', '270°',   270),
+        '4': ('hflip',       'mirror', 0),
     }
     if mode not in vf_map:
         print("Invalid choice")
         return
 
-    vf, label = vf_map[mode]
+    vf, label, degrees = vf_map[mode]
     prefix = 'mirrored' if mode == '4' else 'rotated'
+    workers = max(1, (os.cpu_count() or 1) // ROTATE_ENCODE_THREADS)
+    job = partial(_rotate_video_file, vf=vf, degrees=degrees, mirror=(mode == '4'),
+                  output=output, prefix=prefix, lossless=lossless)
     ok, fail = 0, 0
-    for f in files:
-        try:
-            out = output / f"{prefix}_{f.name}"
-            r = subprocess.run(
-                ['ffmpeg', '-i', str(f), '-vf', vf, '-c:a', 'copy', '-y', str(out)],
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
-            if r.returncode == 0:
-                print(f"OK {f.name} ({label})")
-                ok += 1
-            else:
-                fail += 1
-        except:
+    for f, (success, copied, err) in zip(files, run_parallel(job, files, workers)):
+        if success:
+            print(f"OK {f.name} ({label}, lossless)" if copied else f"OK {f.name} ({label})")
+            ok += 1
+        else:
+            print(f"ERR {f.name}: {err}")
             fail += 1
     print(f"\nProcessed: {ok} | Failed: {fail}")
 
@@ -699,33 +966,54 @@ def rotate_videos(files: List[Path], mode: str, output: Path):
 # TOOL 13: SAMPLE RATE DETECTOR
 # ============================================================================
 
+# e.g. "Sample Specification: s16le 2ch 44100Hz"
+_SAMPLE_RATE_RE = re.compile(rb'Sample Specification:[^\n]*?(\d+)Hz')
+
+
+def _current_sample_rate() -> Optional[str]:
+    # One C-level search over the raw bytes; only the matched digits are decoded
+    result = subprocess.run(['pactl', 'list', 'sink-inputs'],
+                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=5)
+    m = _SAMPLE_RATE_RE.search(result.stdout)
+    return m.group(1).decode() if m else None
+
+
+def _show_sample_rate():
+    try:
+        rate = _current_sample_rate()
+    except subprocess.TimeoutExpired:
+        # A stalled sound server: the child is killed, keep the last reading
+        return
+    if rate:
+        print(f"\rCurrent sample rate: {rate} Hz", end='', flush=True)
+    else:
+        print("\rNo audio stream detected", end='', flush=True)
+
+
 def monitor_sample_rate():
     print("Monitoring audio sample rate (Ctrl+C to stop)...")
     print("Note: This requires PulseAudio")
     
+    proc = None
     try:
-        while True:
-            try:
-                result = subprocess.run(['pactl', 'list', 'sink-inputs'],
-                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                
-                for line in result.stdout.splitlines():
-                    if 'Sample Specification' in line:
-                        spec = line.split(':')[1].strip()
-                        parts = spec.split()
-                        if len(parts) > 2:
-                            rate = parts[2].replace("Hz", "")
-                            print(f"\rCurrent sample rate: {rate} Hz", end='', flush=True)
-                            break
-                else:
-                    print("\rNo audio stream detected", end='', flush=True)
-                
-                time.sleep(1)
-            except Exception as e:
-                print(f"\nError: {e}")
-                break
+        _show_sample_rate()
+        # pactl subscribe prints one line per server event and otherwise
+        # blocks, so the rate is re-read only when a stream appears, changes
+        # or goes away instead of forking pactl every second.
+        proc = subprocess.Popen(['pactl', 'subscribe'],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        for line in proc.stdout:
+            if 'sink-input' in line:
+                _show_sample_rate()
+        print("\nError: PulseAudio event stream closed")
     except KeyboardInterrupt:
         print("\n\nStopped monitoring")
+    except Exception as e:
+        print(f"\nError: {e}")
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
 
 
 # ============================================================================
@@ -763,10 +1051,237 @@ def scale_image(input_path: Path, output: Path, w: int, h: int, mode: str):
 # TOOL 15: SORT BY RESOLUTION
 # ============================================================================
 
+try:
+    import imagesize
+    HAS_IMAGESIZE = True
+except ImportError:
+    HAS_IMAGESIZE = False
+
+
+_PNG_MAGIC  = b'\x89PNG\r\n\x1a\n'
+# Start-of-frame markers; C4 (DHT), C8 (JPG) and CC (DAC) share the range
+_JPEG_SOF   = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+# Marker hops before giving up on a JPEG; real files reach SOF in well under
+# twenty (APPn, DQT, DHT...), so this only stops corrupt or hostile input.
+_JPEG_MAX_SEGMENTS = 64
+
+
+# Each reader gets a raw fd and pulls exactly the bytes it needs with os.pread
+# (one syscall, no buffer, no seek); it returns None when the magic does not
+# match so a mislabelled file still reaches PIL.
+
+def _png_dimensions(fd: int) -> Optional[Tuple[int, int]]:
+    head = os.pread(fd, 24, 0)
+    if len(head) == 24 and head.startswith(_PNG_MAGIC) and head[12:16] == b'IHDR':
+        return _U32X2_BE.unpack_from(head, 16)
+    return None
+
+
+def _gif_dimensions(fd: int) -> Optional[Tuple[int, int]]:
+    head = os.pread(fd, 10, 0)
+    if len(head) == 10 and head[:6] in (b'GIF87a', b'GIF89a'):
+        return _U16X2_LE.unpack_from(head, 6)
+    return None
+
+
+def _bmp_dimensions(fd: int) -> Optional[Tuple[int, int]]:
+    head = os.pread(fd, 26, 0)
+    if len(head) < 26 or head[:2] != b'BM':
+        return None
+    if _U32_LE.unpack_from(head, 14)[0] == 12:      # OS/2 BITMAPCOREHEADER
+        return _U16X2_LE.unpack_from(head, 18)
+    w, h = _I32X2_LE.unpack_from(head, 18)
+    return w, abs(h)                                # negative = top-down rows
+
+
+def _webp_dimensions(fd: int) -> Optional[Tuple[int, int]]:
+    head = os.pread(fd, 30, 0)
+    if len(head) < 30 or head[:4] != b'RIFF' or head[8:12] != b'WEBP':
+        return None
+    chunk = head[12:16]
+    if chunk == b'VP8 ':
+        w, h = _U16X2_LE.unpack_from(head, 26)
+        return w & 0x3FFF, h & 0x3FFF
+    if chunk == b'VP8L':
+        bits = _U32_LE.unpack_from(head, 21)[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X':
+        return (int.from_bytes(head[24:27], 'little') + 1,
+                int.from_bytes(head[27:30], 'little') + 1)
+    return None
+
+
+def _jpeg_dimensions(fd: int) -> Optional[Tuple[int, int]]:
+    # Hop from marker to marker, skipping segment bodies (EXIF thumbnails,
+    # ICC profiles) without reading them, however large they are.
+    if os.pread(fd, 2, 0) != b'\xff\xd8':
+        return None
+    pos = 2
+    for _ in range(_JPEG_MAX_SEGMENTS):
+        seg = os.pread(fd, 9, pos)      # marker, length, precision, height, width
+        if len(seg) < 4 or seg[0] != 0xFF:
+            return None
+        marker = seg[1]
+        if marker == 0xFF:                              # fill byte
+            pos += 1
+        elif marker == 0x01 or 0xD0 <= marker <= 0xD8:  # no length field
+            pos += 2
+        elif marker in _JPEG_SOF:
+            if len(seg) < 9:
+                return None
+            h, w = _U16X2_BE.unpack_from(seg, 5)
+            return w, h
+        else:
+            length = _U16_BE.unpack_from(seg, 2)[0]
+            if length < 2:
+                return None
+            pos += 2 + length
+    return None
+
+
+_IMAGE_DIMENSION_READERS = {
+    '.png':  _png_dimensions,
+    '.gif':  _gif_dimensions,
+    '.bmp':  _bmp_dimensions,
+    '.webp': _webp_dimensions,
+    '.jpg':  _jpeg_dimensions,
+    '.jpeg': _jpeg_dimensions,
+}
+
+
+def _image_dimensions(f: Path) -> Tuple[int, int]:
+    """Read width/height from the file header, falling back to PIL.
+
+    PNG, GIF, BMP and WebP store their size at a fixed offset in the first
+    few bytes and JPEG in its first SOF segment, so neither a decoder nor
+    PIL's plugin lookup is needed for them. The reader is picked by
+    extension; TIFF and anything a reader rejects go to the optional
+    imagesize package when installed, then to PIL.
+    """
+    reader = _IMAGE_DIMENSION_READERS.get(MediaExtensions.ext(f))
+    if reader:
+        fd = os.open(f, os.O_RDONLY)
+        try:
+            dims = reader(fd)
+        finally:
+            os.close(fd)
+        if dims and dims[0] and dims[1]:
+            return tuple(dims)
+    if HAS_IMAGESIZE:
+        w, h = imagesize.get(str(f))    # (-1, -1) when it cannot tell
+        if w > 0 and h > 0:
+            return w, h
+    with Image.open(f) as img:
+        return img.size
+
+
+# Containers whose size is read from tkhd instead of spawning ffprobe
+TKHD_SIZE_EXTS = frozenset({'.mp4', '.mov', '.m4v'})
+
+
+def _iter_mp4_boxes(buf, start: int, end: int):
+    """Yield (type, payload_start, box_end) for each ISO-BMFF box in buf[start:end].
+
+    Works on a read-only mmap so skipping a box (e.g. a multi-GB mdat) is just
+    pointer arithmetic — its pages are never read. Handles 64-bit largesize
+    (size == 1) and to-end-of-parent (size == 0) boxes.
+    """
+    pos = start
+    while pos + 8 <= end:
+        size, typ = _BOX_HEADER.unpack_from(buf, pos)
+        header = 8
+        if size == 1:
+            if pos + 16 > end:
+                break
+            size = _U64_BE.unpack_from(buf, pos + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            break
+        yield typ, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _mp4_dimensions(path: Path) -> Optional[Tuple[int, int]]:
+    """Read the video size from the first tkhd with a nonzero width/height.
+
+    tkhd ends with width and height as 16.16 fixed point, so MP4/MOV sizes
+    come straight out of moov/trak/tkhd without spawning ffprobe. This is the
+    presentation size: for anamorphic video (e.g. 1440x1080 coded with a
+    4:3 pixel aspect) it is the 1920x1080 a player shows, not the coded size
+    ffprobe reports.
+    """
+    try:
+        with open(path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for typ, body, end in _iter_mp4_boxes(mm, 0, len(mm)):
+                if typ != b'moov':
+                    continue
+                for trak, tbody, tend in _iter_mp4_boxes(mm, body, end):
+                    if trak != b'trak':
+                        continue
+                    for sub, sbody, send in _iter_mp4_boxes(mm, tbody, tend):
+                        if sub != b'tkhd' or send - sbody < 84:
+                            continue
+                        w = _U32_BE.unpack_from(mm, send - 8)[0] >> 16
+                        h = _U32_BE.unpack_from(mm, send - 4)[0] >> 16
+                        if w and h:
+                            return w, h
+                break
+    except (OSError, ValueError, struct.error):
+        pass
+    return None
+
+
+def _video_dimensions(f: Path) -> Optional[Tuple[int, int]]:
+    dims = _mp4_dimensions(f) if f.suffix.lower() in TKHD_SIZE_EXTS else None
+    if dims:
+        return dims
+    r = subprocess.run(['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+                      '-show_entries', 'stream=width,height', '-of', 'csv=p=0:s=x', str(f)],
+                     stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
+    if 'x' in r.stdout:
+        w, h = map(int, r.stdout.strip().split('x'))
+        return w, h
+    return None
+
+
+def _probe_dimensions(f: Path) -> Tuple[Optional[Tuple[int, int]], Optional[Exception]]:
+    try:
+        if MediaExtensions.is_image(f):
+            return _image_dimensions(f), None
+        return _video_dimensions(f), None
+    except Exception as e:
+        return None, e
+
+
+# Header reads are short blocking syscalls, so more threads than cores keep
+# the disk busy; each video probe is a whole ffprobe process, so one per core.
+RESOLUTION_IMAGE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+RESOLUTION_VIDEO_WORKERS = os.cpu_count() or 1
+# Renames are metadata-only; a few in flight hide per-call latency on network
+# and FUSE mounts without flooding a local disk's journal.
+RESOLUTION_MOVE_WORKERS = 8
+
+
+def _move_into(pair: Tuple[Path, Path]) -> Tuple[bool, Optional[Exception]]:
+    f, folder = pair
+    try:
+        PathUtils.move(f, folder / f.name)
+        return True, None
+    except Exception as e:
+        return False, e
+
+
 def organize_by_resolution(directory: Path):
     print("Scanning files...")
-    images = FileScanner.scan_image(directory, False)
-    videos = FileScanner.scan_video(directory, False)
+    # One directory pass for both kinds, split afterwards by extension
+    images, videos = [], []
+    for f in FileScanner.scan(directory, MediaExtensions.IMAGE | MediaExtensions.VIDEO):
+        (images if MediaExtensions.is_image(f) else videos).append(f)
     all_files = images + videos
     
     if not all_files:
@@ -774,45 +1289,37 @@ def organize_by_resolution(directory: Path):
         return
     
     print(f"Found {len(all_files)} files. Analyzing...")
-    res_map = {}
+    res_map = defaultdict(list)
     bucket = 200
     
-    for f in all_files:
-        try:
-            if MediaExtensions.is_image(f):
-                with Image.open(f) as img:
-                    w, h = img.size
-            elif MediaExtensions.is_video(f):
-                r = subprocess.run(['ffprobe', '-v', 'error', '-select_streams', 'v:0',
-                                  '-show_entries', 'stream=width,height', '-of', 'csv=p=0:s=x', str(f)],
-                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
-                if 'x' in r.stdout:
-                    w, h = map(int, r.stdout.strip().split('x'))
-                else:
-                    continue
-            else:
-                continue
-            
-            bw = ((w + bucket - 1) // bucket) * bucket
-            bh = ((h + bucket - 1) // bucket) * bucket
-            key = f"{bw}x{bh}"
-            
-            if key not in res_map:
-                res_map[key] = []
-            res_map[key].append(f)
-            print(f"  {f.name} -> {w}x{h} -> {key}")
-        except Exception as e:
-            print(f"  ERR {f.name}: {e}")
+    # ffprobe reads one input per run, so the videos cannot share a process;
+    # instead the probes run side by side, each one waiting on its own child.
+    # Header reads are mostly open/read syscalls, which release the GIL too.
+    results = chain(run_parallel(_probe_dimensions, images, RESOLUTION_IMAGE_WORKERS),
+                    run_parallel(_probe_dimensions, videos, RESOLUTION_VIDEO_WORKERS))
+    for f, (dims, err) in zip(all_files, results):
+        if err:
+            print(f"  ERR {f.name}: {err}")
+            continue
+        if not dims:
+            continue
+        w, h = dims
+        bw = ((w + bucket - 1) // bucket) * bucket
+        bh = ((h + bucket - 1) // bucket) * bucket
+        key = f"{bw}x{bh}"
+        
+        res_map[key].append(f)
+        print(f"  {f.name} -> {w}x{h} -> {key}")
     
     print(f"\nOrganizing into {len(res_map)} groups...")
-    for res, files in res_map.items():
-        folder = directory / res
-        folder.mkdir(exist_ok=True)
-        for f in files:
-            try:
-                f.rename(folder / f.name)
-            except Exception as e:
-                print(f"ERR moving {f.name}: {e}")
+    # Every folder exists before any move starts, so all groups share one
+    # flat list and one pool instead of a pool per group.
+    for res in res_map:
+        (directory / res).mkdir(exist_ok=True)
+    pairs = [(f, directory / res) for res, files in res_map.items() for f in files]
+    for (f, _), (success, err) in zip(pairs, run_parallel(_move_into, pairs, RESOLUTION_MOVE_WORKERS)):
+        if not success:
+            print(f"ERR moving {f.name}: {err}")
     print("Done!")
 
 
@@ -862,21 +1369,24 @@ def view_metadata(filepath: Path):
                     if val:
                         print(f"{field.title()}: {val}")
             
-            # Get duration
-            r = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                              '-of', 'default=noprint_wrappers=1:nokey=1', str(filepath)],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            if r.returncode == 0:
-                dur = float(r.stdout.strip())
+            # Get duration: mutagen already parsed the stream header above, so
+            # only spawn ffprobe for files it could not read
+            dur = getattr(getattr(meta.audio, 'info', None), 'length', None)
+            if not dur:
+                r = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                                  '-of', 'default=noprint_wrappers=1:nokey=1', str(filepath)],
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
+                if r.returncode == 0:
+                    dur = float(r.stdout.strip())
+            if dur:
                 mins, secs = divmod(int(dur), 60)
                 print(f"Duration: {mins:02d}:{secs:02d}")
         
         elif MediaExtensions.is_video(filepath):
-            import json
             r = subprocess.run(['ffprobe', '-v', 'error', '-show_entries',
                               'stream=width,height,codec_name:format=duration',
                               '-of', 'json', str(filepath)],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
             if r.returncode == 0:
                 data = json.loads(r.stdout)
                 if 'streams' in data:
@@ -916,7 +1426,6 @@ def view_metadata(filepath: Path):
 # ============================================================================
 
 import io
-import struct
 import zipfile
 from datetime import datetime, timedelta
 from enum import IntEnum
@@ -1110,20 +1619,67 @@ class RecoverDate:
     MIN_YEAR = 1990
     MAX_YEAR = datetime.now().year
 
-    IMAGE_EXTS = {'.jpg','.jpeg','.tif','.tiff','.png','.heic','.heif',
-                  '.webp','.cr2','.nef','.arw','.orf','.rw2','.dng','.raw'}
-    VIDEO_EXTS = {'.mp4','.m4v','.mov','.3gp','.avi','.mkv','.wmv','.flv'}
-    AUDIO_EXTS = {'.mp3','.m4a','.aac','.flac','.ogg','.opus','.wma','.wav','.aiff'}
-    OFFICE_EXTS= {'.docx','.xlsx','.pptx','.odt','.ods','.odp'}
+    IMAGE_EXTS = frozenset({'.jpg','.jpeg','.tif','.tiff','.png','.heic','.heif',
+                            '.webp','.cr2','.nef','.arw','.orf','.rw2','.dng','.raw'})
+    VIDEO_EXTS = frozenset({'.mp4','.m4v','.mov','.3gp','.avi','.mkv','.wmv','.flv'})
+    AUDIO_EXTS = frozenset({'.mp3','.m4a','.aac','.flac','.ogg','.opus','.wma','.wav','.aiff'})
+    OFFICE_EXTS= frozenset({'.docx','.xlsx','.pptx','.odt','.ods','.odp'})
+    # Unions used by resolve(), built once instead of per file
+    EXIF_EXTS  = IMAGE_EXTS | VIDEO_EXTS
+    XMP_EXTS   = IMAGE_EXTS | {'.pdf','.ai','.eps'}
+    JPEG_EXTS  = frozenset({'.jpg','.jpeg'})
+    MP4_BOX_EXTS = frozenset({'.mp4','.m4v','.mov','.m4a','.3gp'})
+
+    # Compiled once: the strategies below run for every file in the batch
+    _XMP_DATE_RE = re.compile(
+        rb'(?:xmp:CreateDate|xmp:ModifyDate|photoshop:DateCreated|'
+        rb'xmpMM:CreateDate|exif:DateTimeOriginal)[^>]*>([^<]{10,25})<',
+        re.IGNORECASE
+    )
+    _RAW_DATETIME_RE = re.compile(
+        rb'(\d{4})[:\-/](\d{2})[:\-/](\d{2})[T ](\d{2}):(\d{2}):(\d{2})'
+    )
+    _PDF_DATE_RE     = re.compile(r"D:(\d{4})(\d{2})(\d{2})")
+    _PDF_RAW_DATE_RE = re.compile(rb"D:(\d{4})(\d{2})(\d{2})")
+    _ISO_DATE_RE     = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+    _OFFICE_TAG_RES  = tuple(re.compile(rf'<{tag}[^>]*>([^<]+)<')
+                             for tag in ('dcterms:created', 'dcterms:modified', 'dc:date'))
+    # (pattern, year group, month group, day group)
+    _FILENAME_DATE_RES = tuple((re.compile(pat), yi, mi, di) for pat, yi, mi, di in [
+        (r'(?:IMG|VID|DSC|DCIM|PIC|MOV|PICT|photo)[_\-]?(\d{4})(\d{2})(\d{2})', 1, 2, 3),
+        (r'(\d{4})[_\-](\d{2})[_\-](\d{2})', 1, 2, 3),
+        (r'(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)',1, 2, 3),
+        (r'[Ss]creenshot[_\- ](\d{4})[_\-](\d{2})[_\-](\d{2})', 1, 2, 3),
+        (r'WhatsApp\s+\w+\s+(\d{4})-(\d{2})-(\d{2})', 1, 2, 3),
+        (r'(?:^|[_\-\s(])(\d{4})(?:$|[_\-\s)])', 1, None, None),
+    ])
 
     def __init__(self):
         self.recovery_date: Optional[datetime] = None
         self.drive_year_min: int = self.MIN_YEAR
         self.drive_year_max: int = self.MAX_YEAR
         self.stats = {'renamed': 0, 'skipped': 0, 'failed': 0}
+        self._head_path: Optional[Path] = None
+        self._head: bytes = b''
 
     # ── helpers ───────────────────────────────────────────────────────────────
 
+    # Largest prefix any raw-byte strategy scans (MakerNotes)
+    HEAD_BYTES = 524288
+
+    def _read_head(self, path: Path, size: int) -> bytes:
+        """Return the first `size` bytes of path.
+
+        XMP, MakerNotes, PDF and the JPEG quantization scan all look at the
+        start of the same file; read it once in one large block per resolve()
+        and hand out slices instead of reopening it for every strategy.
+        """
+        if self._head_path != path:
+            with open(path, 'rb') as f:
+                self._head = f.read(self.HEAD_BYTES)
+            self._head_path = path
+        return self._head[:size]
+
     def _sane(self, dt: Optional[datetime]) -> Optional[datetime]:
         if dt and self.MIN_YEAR <= dt.year <= self.MAX_YEAR:
             return dt
@@ -1154,7 +1710,7 @@ class RecoverDate:
             if marker == 0xD8: i += 2; continue
             if marker in (0xD9, 0xDA): break
             if i + 3 >= len(data): break
-            length = struct.unpack_from(">H", data, i+2)[0]
+            length = _U16_BE.unpack_from(data, i+2)[0]
             if marker == 0xDB:
                 offset, end = i + 4, i + 2 + length
                 while offset + 65 <= end:
@@ -1166,7 +1722,7 @@ class RecoverDate:
                         offset += 65
                     else:
                         if table_id == 0:
-                            return tuple(struct.unpack_from(">64H", data, offset+1))
+                            return _QT_16BIT.unpack_from(data, offset+1)
                         offset += 129
             i += 2 + length
         return None
@@ -1256,14 +1812,8 @@ class RecoverDate:
         return None
 
     def _xmp(self, path: Path) -> Optional[datetime]:
-        _re = re.compile(
-            rb'(?:xmp:CreateDate|xmp:ModifyDate|photoshop:DateCreated|'
-            rb'xmpMM:CreateDate|exif:DateTimeOriginal)[^>]*>([^<]{10,25})<',
-            re.IGNORECASE
-        )
         try:
-            with open(path, 'rb') as f:
-                data = f.read(131072)
+            data = self._read_head(path, 131072)
             start = data.find(b'<xpacket')
             if start == -1:
                 start = data.find(b'<?xpacket')
@@ -1271,7 +1821,7 @@ class RecoverDate:
                 return None
             end = data.find(b'</xmpmeta>', start)
             block = data[start: end+200] if end != -1 else data[start: start+65536]
-            for m in _re.finditer(block):
+            for m in self._XMP_DATE_RE.finditer(block):
                 dt = self._sane(self._parse_dt(m.group(1).decode(errors='ignore').strip()))
                 if dt:
                     return dt
@@ -1280,13 +1830,9 @@ class RecoverDate:
         return None
 
     def _makernotes(self, path: Path) -> Optional[datetime]:
-        _re = re.compile(
-            rb'(\d{4})[:\-/](\d{2})[:\-/](\d{2})[T ](\d{2}):(\d{2}):(\d{2})'
-        )
         try:
-            with open(path, 'rb') as f:
-                data = f.read(min(524288, os.path.getsize(path)))
-            for m in _re.finditer(data):
+            data = self._read_head(path, 524288)
+            for m in self._RAW_DATETIME_RE.finditer(data):
                 try:
                     dt = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)),
                                   int(m.group(4)), int(m.group(5)), int(m.group(6)))
@@ -1299,16 +1845,8 @@ class RecoverDate:
         return None
 
     def _filename(self, path: Path) -> Tuple[Optional[datetime], DatePrecision]:
-        patterns = [
-            (r'(?:IMG|VID|DSC|DCIM|PIC|MOV|PICT|photo)[_\-]?(\d{4})(\d{2})(\d{2})', 1, 2, 3),
-            (r'(\d{4})[_\-](\d{2})[_\-](\d{2})', 1, 2, 3),
-            (r'(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)',1, 2, 3),
-            (r'[Ss]creenshot[_\- ](\d{4})[_\-](\d{2})[_\-](\d{2})', 1, 2, 3),
-            (r'WhatsApp\s+\w+\s+(\d{4})-(\d{2})-(\d{2})', 1, 2, 3),
-            (r'(?:^|[_\-\s(])(\d{4})(?:$|[_\-\s)])', 1, None, None),
-        ]
-        for pat, yi, mi, di in patterns:
-            m = re.search(pat, path.stem)
+        for pat, yi, mi, di in self._FILENAME_DATE_RES:
+            m = pat.search(path.stem)
             if not m:
                 continue
             try:
@@ -1332,26 +1870,30 @@ class RecoverDate:
 
     def _video_container(self, path: Path) -> Optional[datetime]:
         try:
-            with open(path, 'rb') as f:
-                data = f.read(min(2097152, os.path.getsize(path)))
             ext = path.suffix.lower()
-            if ext in ('.mp4', '.m4v', '.mov', '.m4a', '.3gp'):
+            if ext in self.MP4_BOX_EXTS:
+                # mvhd lives inside moov, which is often written after mdat;
+                # walk the box tree over an mmap instead of a fixed-size prefix
                 QT_EPOCH = datetime(1904, 1, 1)
-                idx = 0
-                while idx < len(data) - 8:
-                    size = struct.unpack_from(">I", data, idx)[0]
-                    if data[idx+4:idx+8] == b'mvhd' and size >= 24:
-                        v = data[idx+8]
-                        secs = struct.unpack_from(">I", data, idx+12)[0] if v == 0 \
-                               else struct.unpack_from(">Q", data, idx+12)[0]
-                        if secs > 0:
-                            return self._sane(QT_EPOCH + timedelta(seconds=int(secs)))
-                    if size < 8: break
-                    idx += size
+                with open(path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for typ, body, end in _iter_mp4_boxes(mm, 0, len(mm)):
+                        if typ != b'moov':
+                            continue
+                        for sub, sbody, send in _iter_mp4_boxes(mm, body, end):
+                            if sub != b'mvhd' or sbody + 12 > send:
+                                continue
+                            secs = _U32_BE.unpack_from(mm, sbody+4)[0] if mm[sbody] == 0 \
+                                   else _U64_BE.unpack_from(mm, sbody+4)[0]
+                            if secs > 0:
+                                return self._sane(QT_EPOCH + timedelta(seconds=int(secs)))
+                        break
             elif ext == '.avi':
+                with open(path, 'rb') as f:
+                    data = f.read(2097152)
                 idx = data.find(b'IDIT')
                 if idx != -1:
-                    sz  = struct.unpack_from("<I", data, idx+4)[0]
+                    sz  = _U32_LE.unpack_from(data, idx+4)[0]
                     raw = data[idx+8: idx+8+sz].decode(errors='ignore').strip('\x00').strip()
                     for fmt in ("%a %b %d %H:%M:%S %Y", "%Y-%m-%d %H:%M:%S"):
                         try:
@@ -1381,22 +1923,19 @@ class RecoverDate:
         return None
 
     def _pdf(self, path: Path) -> Optional[datetime]:
-        _re = re.compile(rb"D:(\d{4})(\d{2})(\d{2})")
         if HAS_PYMUPDF:
             try:
                 doc = fitz.open(str(path))
                 for key in ('creationDate', 'modDate'):
                     raw = doc.metadata.get(key, '')
                     if raw:
-                        m = re.match(r"D:(\d{4})(\d{2})(\d{2})", raw.strip())
+                        m = self._PDF_DATE_RE.match(raw.strip())
                         if m:
                             return self._sane(datetime(int(m.group(1)), int(m.group(2)), int(m.group(3))))
             except Exception:
                 pass
         try:
-            with open(path, 'rb') as f:
-                data = f.read(min(65536, os.path.getsize(path)))
-            m = _re.search(data)
+            m = self._PDF_RAW_DATE_RE.search(self._read_head(path, 65536))
             if m:
                 return self._sane(datetime(int(m.group(1)), int(m.group(2)), int(m.group(3))))
         except Exception:
@@ -1404,16 +1943,15 @@ class RecoverDate:
         return None
 
     def _office(self, path: Path) -> Optional[datetime]:
-        _re = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
         try:
             with zipfile.ZipFile(path) as z:
                 if 'docProps/core.xml' not in z.namelist():
                     return None
                 xml = z.read('docProps/core.xml').decode(errors='ignore')
-                for tag in ('dcterms:created', 'dcterms:modified', 'dc:date'):
-                    m = re.search(rf'<{tag}[^>]*>([^<]+)<', xml)
+                for tag_re in self._OFFICE_TAG_RES:
+                    m = tag_re.search(xml)
                     if m:
-                        dm = _re.search(m.group(1))
+                        dm = self._ISO_DATE_RE.search(m.group(1))
                         if dm:
                             return self._sane(datetime(int(dm.group(1)), int(dm.group(2)), int(dm.group(3))))
         except Exception:
@@ -1446,9 +1984,10 @@ class RecoverDate:
     def resolve(self, path: Path) -> DateResult:
         ext  = path.suffix.lower()
         make = model = None
+        self._head_path = None   # never reuse bytes from an earlier call
 
         # 1. EXIF DateTimeOriginal
-        if ext in self.IMAGE_EXTS | self.VIDEO_EXTS:
+        if ext in self.EXIF_EXTS:
             dt, make, model = self._exif(path)
             if dt:
                 return DateResult(dt, DatePrecision.FULL, "EXIF DateTimeOriginal")
@@ -1460,7 +1999,7 @@ class RecoverDate:
                 return DateResult(dt, DatePrecision.FULL, "Thumbnail EXIF")
 
         # 3. XMP block
-        if ext in self.IMAGE_EXTS | {'.pdf', '.ai', '.eps'}:
+        if ext in self.XMP_EXTS:
             dt = self._xmp(path)
             if dt:
                 return DateResult(dt, DatePrecision.FULL, "XMP metadata")
@@ -1506,11 +2045,9 @@ class RecoverDate:
         device_floor = self._lookup_device(make or "", model or "") if (make or model) else None
 
         qt_floor = None
-        if ext in {'.jpg', '.jpeg'}:
+        if ext in self.JPEG_EXTS:
             try:
-                with open(path, 'rb') as f:
-                    raw_bytes = f.read(min(65536, os.path.getsize(path)))
-                qt = self._extract_luma_qt(raw_bytes)
+                qt = self._extract_luma_qt(self._read_head(path, 65536))
                 if qt:
                     qt_floor = self._match_qt(qt)
             except Exception:
@@ -1673,21 +2210,26 @@ def show_menu(cmds: List[str], sel: int):
             print(f"  {cmd}\n")
 
 
+# Menu entries that only shell out to ffmpeg; checked once in run_command
+FFMPEG_COMMANDS = frozenset({"Change Volume", "Convert to Opus", "Lossless Separator",
+                             "Remove Audio", "Rotate Video"})
+
+
 def run_command(cmd: str):
     clear()
     
-    if cmd == "Change Volume":
-        if not check_ffmpeg():
-            print("Error: ffmpeg not found")
-        else:
-            p = PathUtils.get_valid_path("File or directory: ")
-            inc = UserInput.choice("Volume:", {'1': 'Reduce', '2': 'Increase'}) == '2'
-            pct = UserInput.number("Percentage (1-100): ", 1, 100)
-            db = pct if inc else -pct
-            files = [p] if p.is_file() else FileScanner.scan_audio(p, False)
-            if files:
-                out = PathUtils.ensure_output_dir(p.parent if p.is_file() else p)
-                adjust_volume(files, db, out)
+    if cmd in FFMPEG_COMMANDS and not check_ffmpeg():
+        print("Error: ffmpeg not found")
+    
+    elif cmd == "Change Volume":
+        p = PathUtils.get_valid_path("File or directory: ")
+        inc = UserInput.choice("Volume:", {'1': 'Reduce', '2': 'Increase'}) == '2'
+        pct = UserInput.number("Percentage (1-100): ", 1, 100)
+        db = pct if inc else -pct
+        files = [p] if p.is_file() else FileScanner.scan_audio(p, False)
+        if files:
+            out = PathUtils.ensure_output_dir(p.parent if p.is_file() else p)
+            adjust_volume(files, db, out)
     
     elif cmd == "Compare Audio":
         f1 = PathUtils.get_valid_path("First audio file: ")
@@ -1695,15 +2237,12 @@ def run_command(cmd: str):
         compare_audio_spectrograms(f1, f2)
     
     elif cmd == "Convert to Opus":
-        if not check_ffmpeg():
-            print("Error: ffmpeg not found")
-        else:
-            d = PathUtils.get_valid_path("Directory: ")
-            files = FileScanner.scan_audio(d, False)
-            if files:
-                lossless = UserInput.yes_no("Lossless source (FLAC/WAV)?")
-                out = PathUtils.ensure_output_dir(d, "Converted")
-                convert_opus(files, lossless, out)
+        d = PathUtils.get_valid_path("Directory: ")
+        files = FileScanner.scan_audio(d, False)
+        if files:
+            lossless = UserInput.yes_no("Lossless source (FLAC/WAV)?")
+            out = PathUtils.ensure_output_dir(d, "Converted")
+            convert_opus(files, lossless, out)
     
     elif cmd == "Generate Album Sections":
         d = PathUtils.get_valid_path("Directory: ")
@@ -1732,39 +2271,38 @@ def run_command(cmd: str):
         RecoverDate().run()
 
     elif cmd == "Remove Audio":
-        if not check_ffmpeg():
-            print("Error: ffmpeg not found")
-        else:
-            d = PathUtils.get_valid_path("Directory: ")
-            files = FileScanner.scan_video(d, False)
-            if files:
-                out = PathUtils.ensure_output_dir(d)
-                remove_video_audio(files, out)
+        d = PathUtils.get_valid_path("Directory: ")
+        files = FileScanner.scan_video(d, False)
+        if files:
+            out = PathUtils.ensure_output_dir(d)
+            remove_video_audio(files, out)
     
     elif cmd == "Remove Metadata":
         d = PathUtils.get_valid_path("Directory: ")
         if UserInput.yes_no("WARNING: Modifies in-place. Continue?"):
             rec = UserInput.yes_no("Recursive?")
-            imgs = FileScanner.scan_image(d, rec)
-            vids = FileScanner.scan_video(d, rec)
+            imgs, vids = [], []
+            for f in FileScanner.scan(d, MediaExtensions.IMAGE | MediaExtensions.VIDEO, rec):
+                (imgs if MediaExtensions.is_image(f) else vids).append(f)
+            if vids and not check_ffmpeg():
+                print(f"Error: ffmpeg not found, skipping {len(vids)} video(s)")
+                vids = []
             if imgs or vids:
                 remove_metadata(imgs + vids)
     
     elif cmd == "Rotate Video":
-        if not check_ffmpeg():
-            print("Error: ffmpeg not found")
-        else:
-            d = PathUtils.get_valid_path("Directory: ")
-            files = FileScanner.scan_video(d, False)
-            if files:
-                mode = UserInput.choice("Transform:", {
-                    '1': '90°  clockwise',
-                    '2': '180° flip',
-                    '3': '270° clockwise',
-                    '4': 'Mirror (horizontal)',
-                })
-                out = PathUtils.ensure_output_dir(d, "Rotated")
-                rotate_videos(files, mode, out)
+        d = PathUtils.get_valid_path("Directory: ")
+        files = FileScanner.scan_video(d, False)
+        if files:
+            mode = UserInput.choice("Transform:", {
+                '1': '90°  clockwise',
+                '2': '180° flip',
+                '3': '270° clockwise',
+                '4': 'Mirror (horizontal)',
+            })
+            lossless = UserInput.yes_no("Lossless for MP4/MOV (metadata only, no re-encode)?", True)
+            out = PathUtils.ensure_output_dir(d, "Rotated")
+            rotate_videos(files, mode, out, lossless)
     
     elif cmd == "Sample Rate Detector":
         monitor_sample_rate()